@@ -0,0 +1,193 @@
+import os
+import json
+import time
+import sqlite3
+
+# ─────────────────────────────────────────
+#  SQLITE STORE
+#  Single connection, opened once at startup
+# ─────────────────────────────────────────
+DB_FILE = os.getenv('VOCAB_DB_FILE', 'vocab.db')
+
+_conn = None
+
+
+def connect(path: str = DB_FILE) -> sqlite3.Connection:
+    """Open the database (once) and make sure the schema exists."""
+    global _conn
+    if _conn is not None:
+        return _conn
+
+    _conn = sqlite3.connect(path)
+    _conn.row_factory = sqlite3.Row
+    _conn.execute("PRAGMA journal_mode=WAL")
+    _conn.execute("PRAGMA synchronous=NORMAL")
+    _conn.execute(
+        "CREATE TABLE IF NOT EXISTS words ("
+        " word TEXT PRIMARY KEY,"
+        " added_date TEXT,"
+        " practice_count INTEGER NOT NULL DEFAULT 0,"
+        " cached_output TEXT,"
+        " cached_at INTEGER"
+        ")"
+    )
+    _conn.execute("CREATE TABLE IF NOT EXISTS kv (k TEXT PRIMARY KEY, v TEXT)")
+    _add_missing_columns(_conn, 'words', {
+        'cached_output': 'TEXT',
+        'cached_at': 'INTEGER',
+    })
+    _conn.commit()
+    return _conn
+
+
+def _add_missing_columns(conn, table: str, columns: dict):
+    """Bring databases created by older versions up to the current schema."""
+    existing = {r['name'] for r in conn.execute(f"PRAGMA table_info({table})")}
+    for name, col_type in columns.items():
+        if name not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {col_type}")
+
+
+def migrate_from_json(json_file: str) -> int:
+    """One-time import of the old JSON word list.
+
+    Runs inside a single transaction, then renames the JSON file so the
+    import never happens twice. Returns the number of rows imported.
+    """
+    if not os.path.exists(json_file):
+        return 0
+
+    with open(json_file, 'r', encoding='utf-8') as f:
+        words = json.load(f)
+
+    conn = connect()
+    with conn:
+        cur = conn.executemany(
+            "INSERT OR IGNORE INTO words (word, added_date, practice_count) VALUES (?, ?, ?)",
+            [(w['word'], w.get('added_date'), w.get('practice_count', 0)) for w in words]
+        )
+    os.replace(json_file, json_file + '.migrated')
+    return cur.rowcount
+
+
+def migrate_chat_id_file(chat_id_file: str) -> bool:
+    """One-time import of the old chat-id text file into the kv table.
+
+    Returns True only if the file's id was actually stored.
+    """
+    if not os.path.exists(chat_id_file):
+        return False
+
+    with open(chat_id_file, 'r') as f:
+        value = f.read().strip()
+
+    # An id already in the kv table wins over the stale file
+    imported = bool(value) and get_kv('chat_id') is None
+    if imported:
+        set_kv('chat_id', value)
+    os.replace(chat_id_file, chat_id_file + '.migrated')
+    return imported
+
+
+def get_kv(key: str):
+    row = connect().execute("SELECT v FROM kv WHERE k = ?", (key,)).fetchone()
+    return row['v'] if row else None
+
+
+def set_kv(key: str, value: str):
+    conn = connect()
+    with conn:
+        conn.execute("INSERT OR REPLACE INTO kv (k, v) VALUES (?, ?)", (key, value))
+
+
+def fetch_words() -> list:
+    rows = connect().execute(
+        "SELECT word, added_date, practice_count FROM words ORDER BY rowid"
+    ).fetchall()
+    return [dict(r) for r in rows]
+
+
+def insert_word(word: str, added_date: str) -> bool:
+    """Returns False if the word already exists."""
+    conn = connect()
+    with conn:
+        cur = conn.execute(
+            "INSERT OR IGNORE INTO words (word, added_date, practice_count) VALUES (?, ?, 0)",
+            (word, added_date)
+        )
+    return cur.rowcount > 0
+
+
+def delete_word(word: str) -> bool:
+    """Returns False if the word was not found."""
+    conn = connect()
+    with conn:
+        cur = conn.execute("DELETE FROM words WHERE word = ?", (word,))
+    return cur.rowcount > 0
+
+
+def word_stats():
+    """Totals plus the most/least practiced words, or None for an empty list."""
+    conn = connect()
+    total, total_practice, avg = conn.execute(
+        "SELECT COUNT(*), SUM(practice_count), AVG(practice_count) FROM words"
+    ).fetchone()
+    if not total:
+        return None
+
+    most = conn.execute(
+        "SELECT word, practice_count FROM words ORDER BY practice_count DESC, rowid LIMIT 1"
+    ).fetchone()
+    least = conn.execute(
+        "SELECT word, practice_count FROM words ORDER BY practice_count ASC, rowid LIMIT 1"
+    ).fetchone()
+    return {
+        'total_words': total,
+        'total_practice': total_practice,
+        'avg': avg,
+        'most': dict(most),
+        'least': dict(least),
+    }
+
+
+def bump_practice_counts():
+    conn = connect()
+    with conn:
+        conn.execute("UPDATE words SET practice_count = practice_count + 1")
+
+
+# ─────────────────────────────────────────
+#  GENERATION CACHE
+#  One Gemini result per word, reused until /regenerate
+# ─────────────────────────────────────────
+_MAX_PARAMS = 500  # stay well under SQLite's host-parameter limit
+
+
+def fetch_cached(words: list) -> dict:
+    """Returns {word: cached_output} for every word that has a cached result."""
+    conn = connect()
+    cached = {}
+    for i in range(0, len(words), _MAX_PARAMS):
+        batch = words[i:i + _MAX_PARAMS]
+        placeholders = ",".join("?" * len(batch))
+        rows = conn.execute(
+            f"SELECT word, cached_output FROM words "
+            f"WHERE word IN ({placeholders}) AND cached_output IS NOT NULL",
+            batch
+        )
+        cached.update((r['word'], r['cached_output']) for r in rows)
+    return cached
+
+
+def store_cached(outputs: dict):
+    """Save {word: output} pairs for words that are in the list."""
+    if not outputs:
+        return
+    now = int(time.time())
+    conn = connect()
+    with conn:
+        conn.executemany(
+            "UPDATE words SET cached_output = ?, cached_at = ? WHERE word = ?",
+            [(output, now, word) for word, output in outputs.items()]
+        )
+
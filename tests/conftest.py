@@ -0,0 +1,28 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db
+import vocab_bot
+from helpers import FakeGemini
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Fresh SQLite database and word caches in a temp directory."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(db, '_conn', None)
+    db.connect(str(tmp_path / 'vocab.db'))
+    vocab_bot.init_words()
+    yield db
+    db._conn.close()
+
+
+@pytest.fixture
+def gemini(monkeypatch):
+    fake = FakeGemini()
+    monkeypatch.setattr(vocab_bot, 'client', fake)
+    return fake
@@ -0,0 +1,55 @@
+import re
+from types import SimpleNamespace
+
+
+def make_block(i, word):
+    return (
+        f"[{i}]. WORD: {word}\n"
+        f"Sentence: I like the word {word}.\n"
+        f"Sinhala Meaning: අර්ථය\n"
+        f"Sinhala Sentence: මම {word} වචනයට කැමතියි."
+    )
+
+
+class FakeGemini:
+    """Stands in for genai.Client (plain, async and streamed generate_content)."""
+
+    def __init__(self):
+        self.calls = []
+        self.fail_words = set()  # any request containing one of these raises
+        self.finish_reason = 'STOP'
+        self.reply = None  # override the generated reply text
+        self.models = SimpleNamespace(generate_content=self._generate)
+        self.aio = SimpleNamespace(models=SimpleNamespace(
+            generate_content=self._agenerate,
+            generate_content_stream=self._stream,
+        ))
+
+    def _reply_for(self, contents):
+        words = re.findall(r'^\d+\. (.+)$', contents, re.M)
+        self.calls.append(words)
+        if self.fail_words.intersection(words):
+            raise RuntimeError("quota exceeded")
+        if self.reply is not None:
+            return self.reply
+        return "\n\n".join(make_block(i, w) for i, w in enumerate(words, 1))
+
+    def _generate(self, model, contents):
+        return SimpleNamespace(text=self._reply_for(contents))
+
+    async def _agenerate(self, model, contents):
+        return self._generate(model, contents)
+
+    async def _stream(self, model, contents):
+        text   = self._reply_for(contents)
+        pieces = [text[k:k + 7] for k in range(0, len(text), 7)] or [""]
+
+        async def gen():
+            for n, piece in enumerate(pieces, 1):
+                reason = self.finish_reason if n == len(pieces) else None
+                yield SimpleNamespace(
+                    text=piece,
+                    candidates=[SimpleNamespace(finish_reason=reason)]
+                )
+
+        return gen()
@@ -0,0 +1,90 @@
+import json
+import os
+
+import db
+
+
+def test_migrate_from_json_imports_once_and_renames(store, tmp_path):
+    path = tmp_path / 'english_words.json'
+    path.write_text(json.dumps([
+        {'word': 'apple', 'added_date': '2024-01-01 09:00:00', 'practice_count': 3},
+        {'word': 'පොත', 'added_date': '2024-01-02 09:00:00', 'practice_count': 0},
+    ], ensure_ascii=False), encoding='utf-8')
+
+    assert db.migrate_from_json(str(path)) == 2
+    assert not path.exists()
+    assert os.path.exists(str(path) + '.migrated')
+    assert db.fetch_words() == [
+        {'word': 'apple', 'added_date': '2024-01-01 09:00:00', 'practice_count': 3},
+        {'word': 'පොත', 'added_date': '2024-01-02 09:00:00', 'practice_count': 0},
+    ]
+    assert db.migrate_from_json(str(path)) == 0
+
+
+def test_migrate_keeps_existing_rows(store, tmp_path):
+    db.insert_word('apple', 'now')
+    path = tmp_path / 'english_words.json'
+    path.write_text(json.dumps([{'word': 'apple', 'practice_count': 9}]), encoding='utf-8')
+
+    db.migrate_from_json(str(path))
+
+    assert db.fetch_words() == [{'word': 'apple', 'added_date': 'now', 'practice_count': 0}]
+
+
+def test_insert_and_delete_report_changes(store):
+    assert db.insert_word('apple', 'now')
+    assert not db.insert_word('apple', 'later')
+    assert db.delete_word('apple')
+    assert not db.delete_word('apple')
+
+
+def test_bump_practice_counts(store):
+    db.insert_word('apple', 'now')
+    db.insert_word('pear', 'now')
+
+    db.bump_practice_counts()
+
+    assert [w['practice_count'] for w in db.fetch_words()] == [1, 1]
+
+
+def test_word_stats_empty(store):
+    assert db.word_stats() is None
+
+
+def test_word_stats(store):
+    for w in ('apple', 'pear', 'fig'):
+        db.insert_word(w, 'now')
+    db.bump_practice_counts()
+    db.bump_practice_counts()
+    conn = db.connect()
+    with conn:
+        conn.execute("UPDATE words SET practice_count = 5 WHERE word = 'pear'")
+
+    stats = db.word_stats()
+
+    assert stats['total_words'] == 3
+    assert stats['total_practice'] == 9
+    assert stats['avg'] == 3
+    assert stats['most'] == {'word': 'pear', 'practice_count': 5}
+    # ties resolve to the earliest added word, like min() over the list did
+    assert stats['least'] == {'word': 'apple', 'practice_count': 2}
+
+
+def test_migrate_chat_id_file(store, tmp_path):
+    path = tmp_path / 'user_chat_id.txt'
+    path.write_text('12345\n')
+
+    assert db.migrate_chat_id_file(str(path))
+    assert db.get_kv('chat_id') == '12345'
+    assert not path.exists()
+    assert not db.migrate_chat_id_file(str(path))
+
+
+def test_migrate_chat_id_file_keeps_existing_id(store, tmp_path):
+    db.set_kv('chat_id', '999')
+    path = tmp_path / 'user_chat_id.txt'
+    path.write_text('12345\n')
+
+    assert not db.migrate_chat_id_file(str(path))
+    assert db.get_kv('chat_id') == '999'
+    assert not path.exists()
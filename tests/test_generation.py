@@ -0,0 +1,134 @@
+import asyncio
+
+import vocab_bot
+from helpers import make_block
+
+
+def add_words(*words):
+    async def add():
+        for w in words:
+            await vocab_bot.store_word(w)
+    asyncio.run(add())
+
+
+def generate(words):
+    return asyncio.run(vocab_bot.bulk_generate(words))
+
+
+def test_cached_words_skip_gemini(store, gemini):
+    add_words('apple', 'pear')
+    generate(['apple'])
+
+    results = generate(['pear', 'apple'])
+
+    assert gemini.calls == [['apple'], ['pear']]
+    assert results == [make_block(1, 'pear'), make_block(2, 'apple')]
+
+
+def test_failed_generation_is_not_cached(store, gemini):
+    add_words('apple')
+    gemini.fail_words = {'apple'}
+
+    assert generate(['apple']) == ["⚠️ API error: quota exceeded"]
+    assert store.fetch_cached(['apple']) == {}
+
+
+def test_unanswered_words_are_reported_missing(store, gemini):
+    add_words('apple', 'pear')
+    gemini.reply = make_block(2, 'pear')
+
+    results = generate(['apple', 'pear'])
+
+    assert results == ["⚠️ Missing result for: apple", make_block(2, 'pear')]
+    assert list(store.fetch_cached(['apple', 'pear'])) == ['pear']
+
+
+def test_large_lists_are_split_into_numbered_chunks(store, gemini):
+    words = [f"word{i}" for i in range(60)]
+    add_words(*words)
+
+    results = generate(words)
+
+    assert [len(c) for c in gemini.calls] == [25, 25, 10]
+    assert results == [make_block(i, w) for i, w in enumerate(words, 1)]
+
+
+def test_failed_chunk_only_marks_its_own_words(store, gemini):
+    words = [f"word{i}" for i in range(30)]
+    add_words(*words)
+    gemini.fail_words = {'word27'}
+
+    results = generate(words)
+
+    assert results[:25] == [make_block(i, w) for i, w in enumerate(words[:25], 1)]
+    assert results[25:] == ["⚠️ API error: quota exceeded"] * 5
+
+
+def test_parse_block_maps_number_to_word():
+    words = ['apple', 'pear']
+
+    assert vocab_bot.parse_block("\n" + make_block(2, 'pear') + "\n", words) == \
+        ('pear', make_block(2, 'pear')[len('[2]. '):])
+    assert vocab_bot.parse_block(make_block(3, 'fig'), words) is None
+    assert vocab_bot.parse_block("Here you go:", words) is None
+    assert vocab_bot.parse_block("[1]. WORD: apple\nSentence: Half", words) is None
+
+
+def test_stream_yields_every_block_in_order(store, gemini):
+    words = ['apple', 'pear', 'fig']
+
+    async def collect():
+        return [p async for p in vocab_bot.gemini_stream(words)]
+
+    parsed = asyncio.run(collect())
+
+    assert [w for w, _ in parsed] == words
+    assert parsed[2][1] == make_block(3, 'fig')[len('[3]. '):]
+
+
+def test_send_practice_streams_packed_messages(store, gemini):
+    words = ['apple', 'pear']
+    add_words(*words)
+    sent = []
+
+    async def send(text):
+        sent.append(text)
+
+    asyncio.run(vocab_bot.send_practice(send, words, "H\n\n", "DONE"))
+
+    assert len(sent) == 1
+    assert sent[0].startswith("H\n\n" + make_block(1, 'apple'))
+    assert sent[0].endswith("DONE")
+
+
+def test_regenerate_failure_keeps_cached_example(store, gemini):
+    add_words('apple')
+    generate(['apple'])
+    cached = store.fetch_cached(['apple'])
+
+    gemini.reply = "Sorry, I can't help with that."
+    results = asyncio.run(vocab_bot.bulk_generate(['apple'], use_cache=False))
+
+    assert results == ["⚠️ Missing result for: apple"]
+    assert store.fetch_cached(['apple']) == cached
+
+
+def test_regenerate_success_overwrites_cache(store, gemini):
+    add_words('apple')
+    generate(['apple'])
+
+    gemini.reply = make_block(1, 'apple').replace('I like', 'We eat')
+    asyncio.run(vocab_bot.bulk_generate(['apple'], use_cache=False))
+
+    assert 'We eat' in store.fetch_cached(['apple'])['apple']
+    assert len(gemini.calls) == 2
+
+
+def test_truncated_stream_does_not_cache_last_block(store, gemini):
+    add_words('apple', 'pear')
+    gemini.finish_reason = 'MAX_TOKENS'
+
+    results = generate(['apple', 'pear'])
+
+    assert results == [make_block(1, 'apple'), "⚠️ Missing result for: pear"]
+    assert list(store.fetch_cached(['apple', 'pear'])) == ['apple']
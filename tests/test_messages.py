@@ -0,0 +1,69 @@
+import asyncio
+
+import vocab_bot
+
+SEPARATOR = "\n" + "━" * 25 + "\n\n"
+
+
+def chunks(entries, header="", footer="", max_chars=vocab_bot.TELEGRAM_MAX_CHARS):
+    async def gen():
+        for e in entries:
+            yield e
+
+    async def collect():
+        return [c async for c in vocab_bot.chunk_messages(gen(), header, footer, max_chars)]
+
+    return asyncio.run(collect())
+
+
+def test_utf16_len_counts_surrogate_pairs():
+    assert vocab_bot.utf16_len("abc") == 3
+    assert vocab_bot.utf16_len("නිදසුන") == len("නිදසුන")
+    assert vocab_bot.utf16_len("😀") == 2
+
+
+def test_chunks_stay_within_limit():
+    result = chunks(["x" * 30] * 10, max_chars=100)
+
+    assert all(vocab_bot.utf16_len(c) <= 100 for c in result)
+    assert sum(c.count("x" * 30) for c in result) == 10
+
+
+def test_emoji_are_sized_in_utf16_units():
+    # 40 emoji = 80 UTF-16 units; two of them cannot share a 150-unit message
+    result = chunks(["😀" * 40] * 2, max_chars=150)
+
+    assert len(result) == 2
+
+
+def test_oversized_entry_still_sent():
+    assert chunks(["x" * 200], max_chars=100) == ["x" * 200 + SEPARATOR.rstrip()]
+
+
+def test_no_entries_no_messages():
+    assert chunks([]) == []
+
+
+def test_short_practice_is_one_message_with_header_and_footer():
+    result = chunks(["one", "two"], header="H\n\n", footer="DONE")
+
+    assert result == ["H\n\none" + SEPARATOR + "two" + SEPARATOR.rstrip() + "\n\nDONE"]
+
+
+def test_header_counts_toward_first_chunk():
+    result = chunks(["x" * 30] * 10, header="HEADER\n\n", footer="DONE", max_chars=100)
+
+    assert result[0].startswith("HEADER")
+    assert all(vocab_bot.utf16_len(c) <= 100 for c in result)
+    assert sum(c.count("x" * 30) for c in result) == 10
+    assert result[-1].endswith("DONE")
+
+
+def test_footer_sent_alone_when_it_does_not_fit():
+    result = chunks(["x" * 90], footer="DONE", max_chars=100)
+
+    assert result == ["x" * 90 + SEPARATOR.rstrip(), "DONE"]
+
+
+def test_empty_practice_sends_header_and_footer_only():
+    assert chunks([], header="H\n\n", footer="DONE") == ["H\n\nDONE"]
@@ -1,15 +1,21 @@
 import os
-import json
 import re
-from datetime import datetime
+import random
+from datetime import datetime, time as dt_time, timezone
+from zoneinfo import ZoneInfo
 from telegram import Update
-from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
+from telegram.ext import AIORateLimiter, Application, CommandHandler, MessageHandler, filters, ContextTypes
+from telegram.request import HTTPXRequest
 from google import genai
-import schedule
-import time
 import asyncio
-from threading import Thread
-from flask import Flask
+import httpx
+from aiohttp import web
+import db
+
+# Pre-compiled patterns (used on every practice / every added word)
+_BLOCK_RE     = re.compile(r'\n(?=\[\d+\]\.)')
+_BLOCK_NUM_RE = re.compile(r'^\[(\d+)\]\.\s*')
+_WORD_RE      = re.compile(r'^[a-z][a-z\- ]{1,}$')
 
 # ─────────────────────────────────────────
 #  CONFIGURATION  (replace your keys here)
@@ -17,36 +23,70 @@ from flask import Flask
 TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', 'YOUR_TELEGRAM_BOT_TOKEN')
 GEMINI_API_KEY     = os.getenv('GEMINI_API_KEY',     'YOUR_GEMINI_API_KEY')
 PORT               = int(os.getenv('PORT', 8000))  # Koyeb uses PORT env variable
+PRACTICE_TZ_NAME   = os.getenv('PRACTICE_TZ', '').strip()  # e.g. Asia/Colombo, unset = UTC
+
+# UTC needs no tz database, so slim images only need tzdata for a named zone
+PRACTICE_TZ = ZoneInfo(PRACTICE_TZ_NAME) if PRACTICE_TZ_NAME else timezone.utc
 
 CHAT_ID_FILE = 'user_chat_id.txt'
 WORDS_FILE   = 'english_words.json'
 
-# Gemini client
-client       = genai.Client(api_key=GEMINI_API_KEY)
+# Gemini client - created once so its pooled keep-alive connections are reused
+GEMINI_TIMEOUT_MS = 60_000
+client       = genai.Client(api_key=GEMINI_API_KEY, http_options={'timeout': GEMINI_TIMEOUT_MS})
 GEMINI_MODEL = 'models/gemini-2.5-flash'
 
-# Telegram max chars per message
+# Prompt sent for every chunk; only {n} and {numbered} change per call
+PROMPT_TEMPLATE = """You are an expert English-Sinhala language teacher.
+
+For EACH of the following {n} English words, provide:
+- An English example sentence
+- The Sinhala meaning (in Sinhala unicode script, NOT romanized)
+- The Sinhala translation of the sentence (in Sinhala unicode script)
+
+Word list:
+{numbered}
+
+Format your response EXACTLY like this for EVERY word:
+
+[1]. WORD: example
+Sentence: This is an example sentence.
+Sinhala Meaning: නිදසුන
+Sinhala Sentence: මෙය නිදසුන් වාක්‍යයකි.
+
+[2]. WORD: next word
+...and so on for all {n} words.
+
+RULES:
+- Do NOT skip any word
+- Do NOT add extra text or commentary
+- Sinhala MUST be in Sinhala unicode script (not English letters)
+- Keep sentences simple and clear"""
+
+# Large lists are split into chunks sent concurrently (keeps output short)
+GEMINI_CHUNK_SIZE      = 25
+GEMINI_MAX_CONCURRENCY = 4
+_gemini_semaphore      = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+
+# Telegram max chars per message (UTF-16 units, margin below the 4096 limit)
 TELEGRAM_MAX_CHARS = 4000
 
-# Flask app - keeps Koyeb web service alive
-flask_app = Flask(__name__)
+# Web app - keeps Koyeb web service alive (served on the bot's event loop)
+async def home(request):
+    return web.Response(text=f"✅ Vocab Bot is running! Words: {WORD_COUNT}")
 
-@flask_app.route('/')
-def home():
-    try:
-        words = load_words()
-        count = len(words)
-    except Exception:
-        count = 0
-    return f"✅ Vocab Bot is running! Words: {count}", 200
+async def health(request):
+    return web.Response(text="OK")
 
-@flask_app.route('/health')
-def health():
-    return "OK", 200
+async def ping(request):
+    return web.Response(text="pong")
 
-@flask_app.route('/ping')
-def ping():
-    return "pong", 200
+web_app = web.Application()
+web_app.add_routes([
+    web.get('/',       home),
+    web.get('/health', health),
+    web.get('/ping',   ping),
+])
 
 print("✅ Vocab Bot started")
 print(f"✅ Model  : {GEMINI_MODEL}")
@@ -56,128 +96,280 @@ print("✅ Mode   : Web Service (Koyeb free tier compatible)")
 # ─────────────────────────────────────────
 #  SELF-PING: prevents Koyeb from sleeping
 # ─────────────────────────────────────────
-def self_ping():
-    """Ping our own server every 5 minutes to stay awake"""
-    import requests as req
+# One client for the life of the process, so pings reuse its connection
+_ping_client = None
+
+async def self_ping(context: ContextTypes.DEFAULT_TYPE):
+    """Ping our own server (run every 5 minutes by the JobQueue) to stay awake"""
     koyeb_url = os.getenv('KOYEB_URL', '').strip().rstrip('/')
+    if not koyeb_url:
+        return
 
     # Make sure URL has https://
-    if koyeb_url and not koyeb_url.startswith('http'):
+    if not koyeb_url.startswith('http'):
         koyeb_url = 'https://' + koyeb_url
 
-    while True:
-        time.sleep(300)  # every 5 minutes
-        if koyeb_url:
-            try:
-                req.get(f"{koyeb_url}/ping", timeout=10)
-                print("✅ Self-ping sent - staying awake!")
-            except Exception as e:
-                print(f"⚠️ Self-ping failed: {e}")
+    global _ping_client
+    if _ping_client is None:
+        _ping_client = httpx.AsyncClient(timeout=10)
+
+    try:
+        await _ping_client.get(f"{koyeb_url}/ping")
+        print("✅ Self-ping sent - staying awake!")
+    except Exception as e:
+        print(f"⚠️ Self-ping failed: {e}")
 
 
 # ─────────────────────────────────────────
-#  FILE HELPERS
+#  WORD STORE  (SQLite + in-memory cache)
+#  Read once at startup, writes go to both
 # ─────────────────────────────────────────
-def load_words():
-    if os.path.exists(WORDS_FILE):
-        with open(WORDS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return []
+_words_cache = []
+_words_lock  = asyncio.Lock()
+WORD_SET     = set()  # constant-time duplicate check
+WORD_COUNT   = 0  # served by the web app, kept in step with the cache
+
+def init_words():
+    """Open the DB, import the old JSON/txt files once, then fill the caches."""
+    global WORD_COUNT
+    db.connect()
+    migrated = db.migrate_from_json(WORDS_FILE)
+    if migrated:
+        print(f"✅ Migrated {migrated} words from {WORDS_FILE} to SQLite")
+    if db.migrate_chat_id_file(CHAT_ID_FILE):
+        print(f"✅ Migrated chat id from {CHAT_ID_FILE} to SQLite")
+    load_chat_id()
+    _words_cache[:] = db.fetch_words()
+    WORD_SET.clear()
+    WORD_SET.update(w['word'] for w in _words_cache)
+    WORD_COUNT = len(_words_cache)
+
+def get_words():
+    return _words_cache
+
+async def store_word(word):
+    """Returns False if the word is already saved."""
+    global WORD_COUNT
+    added_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    async with _words_lock:
+        if word in WORD_SET or not db.insert_word(word, added_date):
+            return False
+        WORD_SET.add(word)
+        _words_cache.append({
+            'word': word,
+            'added_date': added_date,
+            'practice_count': 0
+        })
+        WORD_COUNT = len(_words_cache)
+    return True
+
+async def delete_word(word):
+    """Returns False if the word was not found."""
+    global WORD_COUNT
+    async with _words_lock:
+        if word not in WORD_SET or not db.delete_word(word):
+            return False
+        WORD_SET.discard(word)
+        for i, w in enumerate(_words_cache):
+            if w['word'] == word:
+                del _words_cache[i]
+                break
+        WORD_COUNT = len(_words_cache)
+    return True
+
+async def bump_practice_counts():
+    """One UPDATE for the whole list; nothing is written for an empty list."""
+    async with _words_lock:
+        if not _words_cache:
+            return
+        db.bump_practice_counts()
+        for w in _words_cache:
+            w['practice_count'] += 1
 
-def save_words(words):
-    with open(WORDS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(words, f, ensure_ascii=False, indent=2)
+# Chat id lives in the kv table; memoized after the first read
+_chat_id = None
 
 def save_chat_id(chat_id):
-    with open(CHAT_ID_FILE, 'w') as f:
-        f.write(str(chat_id))
+    global _chat_id
+    if chat_id == _chat_id:
+        return
+    db.set_kv('chat_id', str(chat_id))
+    _chat_id = chat_id
 
 def load_chat_id():
-    if os.path.exists(CHAT_ID_FILE):
-        with open(CHAT_ID_FILE, 'r') as f:
-            return int(f.read().strip())
-    return None
+    global _chat_id
+    if _chat_id is None:
+        value = db.get_kv('chat_id')
+        _chat_id = int(value) if value else None
+    return _chat_id
 
 
 # ─────────────────────────────────────────
-#  CORE: ONE BULK GEMINI REQUEST
-#  Send ALL words → ONE API call
-#  Returns list of formatted strings (one per word)
+#  CORE: BULK GEMINI REQUESTS
+#  Uncached words → one streamed API call per chunk, chunks run concurrently
+#  Results come back in word order as soon as each one is ready
 # ─────────────────────────────────────────
-def bulk_generate(word_list: list) -> list:
-    if not word_list:
-        return []
-
-    numbered = "\n".join(f"{i+1}. {w}" for i, w in enumerate(word_list))
+async def iter_generate(word_list: list, use_cache: bool = True):
+    """Yields one formatted string per word, in order, as soon as it is ready.
 
-    prompt = f"""You are an expert English-Sinhala language teacher.
-
-For EACH of the following {len(word_list)} English words, provide:
-- An English example sentence
-- The Sinhala meaning (in Sinhala unicode script, NOT romanized)
-- The Sinhala translation of the sentence (in Sinhala unicode script)
+    With use_cache=False every word goes to Gemini; fresh blocks still
+    overwrite the cache, failures leave the old entry in place.
+    """
+    if not word_list:
+        return
 
-Word list:
-{numbered}
+    # Words already generated once are served from the DB cache
+    outputs = db.fetch_cached(word_list) if use_cache else {}
+    misses  = [w for w in word_list if w not in outputs]
 
-Format your response EXACTLY like this for EVERY word:
+    # Each miss resolves to (output, error) once its chunk has streamed it
+    loop    = asyncio.get_running_loop()
+    pending = {w: loop.create_future() for w in misses}
+    chunks  = [misses[i:i + GEMINI_CHUNK_SIZE] for i in range(0, len(misses), GEMINI_CHUNK_SIZE)]
+    tasks   = [asyncio.create_task(generate_chunk(c, pending)) for c in chunks]
 
-[1]. WORD: example
-Sentence: This is an example sentence.
-Sinhala Meaning: නිදසුන
-Sinhala Sentence: මෙය නිදසුන් වාක්‍යයකි.
+    try:
+        for i, w in enumerate(word_list, 1):
+            if w in outputs:
+                yield f"[{i}]. {outputs[w]}"
+                continue
+
+            output, error = await pending[w]
+            if output:
+                yield f"[{i}]. {output}"
+            elif error:
+                yield f"⚠️ API error: {error[:100]}"
+            else:
+                yield f"⚠️ Missing result for: {w}"
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def bulk_generate(word_list: list, use_cache: bool = True) -> list:
+    return [r async for r in iter_generate(word_list, use_cache)]
+
+
+async def generate_chunk(word_list: list, pending: dict):
+    """One Gemini request, limited to GEMINI_MAX_CONCURRENCY at a time.
+
+    Resolves each word's future as its block arrives and caches what was
+    generated, even if the stream fails part-way.
+    """
+    fresh = {}
+    error = None
+    try:
+        async with _gemini_semaphore:
+            async for word, output in gemini_stream(word_list):
+                fresh[word] = output
+                if not pending[word].done():
+                    pending[word].set_result((output, None))
+    except Exception as e:
+        error = str(e)
+        print(f"❌ Gemini error: {error}")
+    finally:
+        db.store_cached(fresh)
+        for w in word_list:
+            if not pending[w].done():
+                pending[w].set_result((None, error))
+
+
+async def gemini_stream(word_list: list):
+    """Streams Gemini's answer; yields (word, block without its [N]. prefix)."""
+    numbered = "\n".join(map("{0[0]}. {0[1]}".format, enumerate(word_list, 1)))
+
+    prompt = PROMPT_TEMPLATE.format(n=len(word_list), numbered=numbered)
+
+    # Every block but the last one in the buffer is complete
+    buffer = ""
+    finish_reason = None
+    stream = await client.aio.models.generate_content_stream(
+        model=GEMINI_MODEL,
+        contents=prompt
+    )
+    async for chunk in stream:
+        if chunk.candidates and chunk.candidates[0].finish_reason:
+            finish_reason = chunk.candidates[0].finish_reason
+        buffer += chunk.text or ""
+        blocks  = _BLOCK_RE.split(buffer)
+        buffer  = blocks.pop()
+        for block in blocks:
+            parsed = parse_block(block, word_list)
+            if parsed:
+                yield parsed
+
+    # The trailing block is only complete if Gemini stopped on its own
+    # (not MAX_TOKENS / SAFETY) - a truncated block must never be cached
+    reason = getattr(finish_reason, 'name', finish_reason)
+    if reason != 'STOP':
+        print(f"⚠️ Gemini stream ended with {reason}; dropping the last block")
+        return
 
-[2]. WORD: next word
-...and so on for all {len(word_list)} words.
+    parsed = parse_block(buffer, word_list)
+    if parsed:
+        yield parsed
 
-RULES:
-- Do NOT skip any word
-- Do NOT add extra text or commentary
-- Sinhala MUST be in Sinhala unicode script (not English letters)
-- Keep sentences simple and clear"""
 
-    try:
-        response = client.models.generate_content(
-            model=GEMINI_MODEL,
-            contents=prompt
-        )
-        raw = response.text.strip()
+def parse_block(block: str, word_list: list):
+    """Map a '[N]. ...' block back to its word by the number Gemini gave it.
 
-        # Split into per-word blocks (each starts with [NUMBER].)
-        blocks = re.split(r'\n(?=\[\d+\]\.)', raw)
-        results = [b.strip() for b in blocks if b.strip()]
+    Blocks without the final 'Sinhala Sentence:' line are incomplete and ignored.
+    """
+    block = block.strip()
+    m = _BLOCK_NUM_RE.match(block)
+    if not m or 'Sinhala Sentence:' not in block:
+        return None
+    idx = int(m.group(1)) - 1
+    if 0 <= idx < len(word_list):
+        return word_list[idx], block[m.end():]
+    return None
 
-        # Pad if any words are missing
-        while len(results) < len(word_list):
-            results.append(f"⚠️ Missing result for: {word_list[len(results)]}")
 
-        return results
+def utf16_len(text: str) -> int:
+    """Message length the way Telegram counts it (UTF-16 code units)."""
+    return len(text.encode('utf-16-le')) // 2
 
-    except Exception as e:
-        err = str(e)
-        print(f"❌ Gemini error: {err}")
-        return [f"⚠️ API error: {err[:100]}"] * len(word_list)
 
+async def chunk_messages(entries, header: str = "", footer: str = "",
+                         max_chars: int = TELEGRAM_MAX_CHARS):
+    """Join streamed word entries and yield Telegram-safe chunks as they fill.
 
-def chunk_messages(entries: list, max_chars: int = TELEGRAM_MAX_CHARS) -> list:
-    """Join word entries and split into Telegram-safe chunks."""
-    chunks = []
-    current = ""
+    The header opens the first chunk and the footer rides on the last one
+    when it fits, so a short practice arrives as a single message.
+    """
+    parts = [header]
+    size  = utf16_len(header)
+    count = 0  # entries in the current chunk
     separator = "\n" + "━" * 25 + "\n\n"
 
-    for entry in entries:
-        block = entry + separator
-        if len(current) + len(block) > max_chars:
-            if current:
-                chunks.append(current.strip())
-            current = block
+    async for entry in entries:
+        block      = entry + separator
+        block_size = utf16_len(block)
+        if count and size + block_size > max_chars:
+            yield "".join(parts).strip()
+            parts = []
+            size  = 0
+            count = 0
+        parts.append(block)
+        size  += block_size
+        count += 1
+
+    current = "".join(parts).strip()
+    if footer:
+        if current and utf16_len(current) + 2 + utf16_len(footer) <= max_chars:
+            current += "\n\n" + footer
         else:
-            current += block
+            if current:
+                yield current
+            current = footer
+    if current:
+        yield current
 
-    if current.strip():
-        chunks.append(current.strip())
 
-    return chunks
+async def send_practice(send, word_list: list, header: str, footer: str):
+    """Send practice messages while Gemini is still generating the rest."""
+    async for chunk in chunk_messages(iter_generate(word_list), header, footer):
+        await send(chunk)
 
 
 # ─────────────────────────────────────────
@@ -186,23 +378,24 @@ def chunk_messages(entries: list, max_chars: int = TELEGRAM_MAX_CHARS) -> list:
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     chat_id = update.effective_chat.id
     save_chat_id(chat_id)
-    words = load_words()
+    words = get_words()
 
     msg = f"""🌟 English Vocabulary Practice Bot 🌟
 
 📚 Commands:
 • Send any word   → adds it + instant example
-• /practice       → ALL words, ONE API call!
+• /practice       → practise ALL your words
 • /list           → see your word list
 • /remove <word>  → delete a word
+• /regenerate <word> → fresh example for a word
 • /stats          → your progress
 
 ⏰ Auto daily practice at 9:00 AM every day!
 
 💡 How it works:
-ALL your words are sent to Gemini in ONE request.
-No more rate limit errors!
-50 words = 1 API call = a few messages!
+Each word's example is generated once and saved.
+New words are sent to Gemini in small batches,
+so practice starts arriving in seconds!
 
 📊 Words saved: {len(words)}
 
@@ -217,72 +410,49 @@ async def add_word(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if word.startswith('/'):
         return
 
-    if len(word) < 2 or not word.replace('-', '').replace(' ', '').isalpha():
+    if not _WORD_RE.match(word):
         await update.message.reply_text("❌ Please send a valid English word.")
         return
 
-    words = load_words()
-
-    if any(w['word'] == word for w in words):
+    if not await store_word(word):
         await update.message.reply_text(f"📌 '{word}' is already in your list!")
         return
 
-    words.append({
-        'word': word,
-        'added_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'practice_count': 0
-    })
-    save_words(words)
-
     await update.message.reply_text(f"✅ Added '{word}'!\n🔄 Generating example...")
 
     # Single word = 1 request
-    results = bulk_generate([word])
+    results = await bulk_generate([word])
     await update.message.reply_text(results[0] if results else "⚠️ Could not generate example.")
 
 
 async def practice_all(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    words = load_words()
+    words = get_words()
 
     if not words:
         await update.message.reply_text("📭 Your list is empty. Send me some words first!")
         return
 
-    import random
     word_names = [w['word'] for w in words]
     random.shuffle(word_names)  # 🔀 Random order every time!
     total = len(word_names)
 
     await update.message.reply_text(
         f"📖 Generating examples for ALL {total} words...\n"
-        f"⚡ ONE Gemini request — please wait 15-30 seconds..."
+        f"⚡ Messages start arriving as soon as the first words are ready..."
     )
 
-    # ── ONE API CALL FOR ALL WORDS ──
-    results = bulk_generate(word_names)
-
-    # Update practice counts
-    for w in words:
-        w['practice_count'] += 1
-    save_words(words)
-
-    # Split into Telegram-safe chunks and send
+    # Stream results and send each Telegram-safe chunk as soon as it fills
     date_str = datetime.now().strftime('%Y-%m-%d')
     header   = f"📚 Practice — {total} words — {date_str}\n\n"
-    chunks   = chunk_messages(results)
-
-    for i, chunk in enumerate(chunks):
-        text = (header + chunk) if i == 0 else chunk
-        await update.message.reply_text(text)
-        await asyncio.sleep(1)  # tiny pause between Telegram messages only
+    footer   = f"✅ Done! {total} words practised! 🎉"
+    await send_practice(update.message.reply_text, word_names, header, footer)
 
-    await update.message.reply_text(
-        f"✅ Done! {total} words practised with just 1 API call! 🎉"
-    )
+    # Update practice counts
+    await bump_practice_counts()
 
 
 async def list_words(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    words = load_words()
+    words = get_words()
 
     if not words:
         await update.message.reply_text("📭 Your vocabulary list is empty.")
@@ -302,28 +472,45 @@ async def remove_word(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     word_to_remove = ' '.join(context.args).lower()
-    words = load_words()
-    new_words = [w for w in words if w['word'] != word_to_remove]
 
-    if len(new_words) < len(words):
-        save_words(new_words)
+    if await delete_word(word_to_remove):
         await update.message.reply_text(f"✅ Removed '{word_to_remove}'.")
     else:
         await update.message.reply_text(f"❌ '{word_to_remove}' not found in your list.")
 
 
+async def regenerate_word(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    if not context.args:
+        await update.message.reply_text("❌ Usage: /regenerate <word>\nExample: /regenerate apple")
+        return
+
+    word = ' '.join(context.args).lower()
+
+    if word not in WORD_SET:
+        await update.message.reply_text(f"❌ '{word}' not found in your list.")
+        return
+
+    # The cached example is only replaced once a fresh one actually arrives
+    await update.message.reply_text(f"🔄 Regenerating example for '{word}'...")
+    results = await bulk_generate([word], use_cache=False)
+    if results and results[0].startswith('⚠️'):
+        await update.message.reply_text(f"{results[0]}\n📌 Your previous example was kept.")
+    else:
+        await update.message.reply_text(results[0] if results else "⚠️ Could not generate example.")
+
+
 async def stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    words = load_words()
+    summary = db.word_stats()
 
-    if not words:
+    if not summary:
         await update.message.reply_text("📭 No stats yet. Add some words first!")
         return
 
-    total_words    = len(words)
-    total_practice = sum(w['practice_count'] for w in words)
-    avg            = total_practice / total_words if total_words > 0 else 0
-    most           = max(words, key=lambda x: x['practice_count'])
-    least          = min(words, key=lambda x: x['practice_count'])
+    total_words    = summary['total_words']
+    total_practice = summary['total_practice']
+    avg            = summary['avg']
+    most           = summary['most']
+    least          = summary['least']
 
     msg = f"""📊 Your Statistics:
 
@@ -347,12 +534,11 @@ async def send_daily_practice(application):
     if not chat_id:
         return
 
-    words = load_words()
+    words = get_words()
     if not words:
         return
 
     try:
-        import random
         word_names = [w['word'] for w in words]
         random.shuffle(word_names)  # 🔀 Random order every day!
         total = len(word_names)
@@ -361,82 +547,82 @@ async def send_daily_practice(application):
             chat_id=chat_id,
             text=(
                 f"🌅 Good morning! Daily Vocabulary Practice\n"
-                f"📚 {total} words → 1 Gemini request → sending now..."
+                f"📚 {total} words → sending now..."
             )
         )
 
-        # ── ONE API CALL FOR ALL WORDS ──
-        results = bulk_generate(word_names)
-
-        # Update practice counts
-        for w in words:
-            w['practice_count'] += 1
-        save_words(words)
+        # Stream results and send in chunks
+        async def send(text):
+            await application.bot.send_message(chat_id=chat_id, text=text)
 
-        # Send in chunks
         header = f"📖 Daily Practice — {datetime.now().strftime('%Y-%m-%d')}\n\n"
-        chunks = chunk_messages(results)
-
-        for i, chunk in enumerate(chunks):
-            text = (header + chunk) if i == 0 else chunk
-            await application.bot.send_message(chat_id=chat_id, text=text)
-            await asyncio.sleep(1)
+        footer = f"✅ Daily practice done! {total} words! Have a great day! 🌟"
+        await send_practice(send, word_names, header, footer)
 
-        await application.bot.send_message(
-            chat_id=chat_id,
-            text=f"✅ Daily practice done! {total} words, 1 API call! Have a great day! 🌟"
-        )
+        # Update practice counts
+        await bump_practice_counts()
 
     except Exception as e:
         print(f"❌ Daily practice error: {e}")
 
 
-def schedule_daily_practice(application, loop):
-    async def job():
-        await send_daily_practice(application)
-
-    def run_job():
-        asyncio.run_coroutine_threadsafe(job(), loop)
-
-    schedule.every().day.at("09:00").do(run_job)
-
-    while True:
-        schedule.run_pending()
-        time.sleep(60)
+async def daily_practice_job(context: ContextTypes.DEFAULT_TYPE):
+    await send_daily_practice(context.application)
 
 
 # ─────────────────────────────────────────
 #  MAIN
 # ─────────────────────────────────────────
 def run_bot():
-    """Run Telegram bot - must handle its own event loop carefully in a thread"""
-    import nest_asyncio
-
-    # Create a new event loop for this thread
+    """Run the Telegram bot and the web server together on one event loop"""
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
 
-    application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+    # Long-lived pooled HTTP clients: one for API calls, a small one for getUpdates
+    application = (
+        Application.builder()
+        .token(TELEGRAM_BOT_TOKEN)
+        .request(HTTPXRequest(connection_pool_size=32, connect_timeout=10, read_timeout=60))
+        .get_updates_request(HTTPXRequest(connection_pool_size=4))
+        # Telegram limits: 30 msg/s overall, 20 msg/min per group; retries on RetryAfter
+        .rate_limiter(AIORateLimiter(
+            overall_max_rate=30, overall_time_period=1,
+            group_max_rate=20, group_time_period=60,
+            max_retries=3
+        ))
+        # Handle updates concurrently so a long /practice doesn't hold up new words
+        .concurrent_updates(True)
+        .build()
+    )
 
     application.add_handler(CommandHandler("start",    start))
     application.add_handler(CommandHandler("list",     list_words))
     application.add_handler(CommandHandler("practice", practice_all))
     application.add_handler(CommandHandler("remove",   remove_word))
+    application.add_handler(CommandHandler("regenerate", regenerate_word))
     application.add_handler(CommandHandler("stats",    stats))
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, add_word))
 
-    # Start scheduler thread
-    scheduler_thread = Thread(
-        target=schedule_daily_practice,
-        args=(application, loop),
-        daemon=True
+    # Daily practice at 09:00 wall-clock time in PRACTICE_TZ (follows DST),
+    # on the bot's own event loop
+    application.job_queue.run_daily(
+        daily_practice_job,
+        time=dt_time(9, 0, tzinfo=PRACTICE_TZ),
+        name="daily_practice"
     )
-    scheduler_thread.start()
+
+    # Self-ping every 5 minutes (no sleeping thread needed)
+    application.job_queue.run_repeating(self_ping, interval=300, first=300, name="self_ping")
 
     print("🤖 Bot is running...")
 
-    # Use updater directly to avoid signal handler issues in threads
+    # Use updater directly so the web server can share the same loop
     async def start_polling():
+        runner = web.AppRunner(web_app)
+        await runner.setup()
+        await web.TCPSite(runner, '0.0.0.0', PORT).start()
+        print(f"🌐 Web server started on port {PORT}")
+
         await application.initialize()
         await application.start()
         await application.updater.start_polling()
@@ -450,20 +636,9 @@ def run_bot():
 
 
 def main():
-    # Flask starts first in background thread
-    flask_thread = Thread(target=lambda: flask_app.run(
-        host='0.0.0.0',
-        port=PORT,
-        use_reloader=False  # Important: disable reloader in thread
-    ), daemon=True)
-    flask_thread.start()
-    print(f"🌐 Flask started on port {PORT}")
-
-    # Self-ping in background thread
-    ping_thread = Thread(target=self_ping, daemon=True)
-    ping_thread.start()
-
-    # Bot runs in main thread (required for signal handling)
+    init_words()
+
+    # Bot and web server share the main thread's event loop
     print("🤖 Starting Telegram bot in main thread...")
     run_bot()
 